@@ -2,28 +2,43 @@
 
 """The fritzbox_anrufe integration."""
 
+import importlib
 import logging
 
-from fritzconnection.core.exceptions import FritzConnectionException, FritzSecurityError
-from requests.exceptions import ConnectionError as RequestsConnectionError
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .base import FritzBoxPhonebook
-from .const import CONF_PHONEBOOK, CONF_PREFIXES, PLATFORMS
+from .const import CONF_PHONEBOOK, CONF_PREFIXES, DOMAIN, PLATFORMS
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 type FritzBoxCallMonitorConfigEntry = ConfigEntry[FritzBoxPhonebook]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the fritzbox_anrufe services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: FritzBoxCallMonitorConfigEntry
 ) -> bool:
     """Set up the fritzbox_anrufe platforms."""
+    exceptions = await hass.async_add_import_executor_job(
+        importlib.import_module, "fritzconnection.core.exceptions"
+    )
+    requests_exceptions = await hass.async_add_import_executor_job(
+        importlib.import_module, "requests.exceptions"
+    )
     fritzbox_phonebook = FritzBoxPhonebook(
         host=config_entry.data[CONF_HOST],
         username=config_entry.data[CONF_USERNAME],
@@ -34,7 +49,7 @@ async def async_setup_entry(
 
     try:
         await hass.async_add_executor_job(fritzbox_phonebook.init_phonebook)
-    except FritzSecurityError as ex:
+    except exceptions.FritzSecurityError as ex:
         _LOGGER.error(
             (
                 "User has insufficient permissions to access AVM FRITZ!Box settings and"
@@ -43,9 +58,9 @@ async def async_setup_entry(
             ex,
         )
         return False
-    except FritzConnectionException as ex:
+    except exceptions.FritzConnectionException as ex:
         raise ConfigEntryAuthFailed from ex
-    except RequestsConnectionError as ex:
+    except requests_exceptions.ConnectionError as ex:
         _LOGGER.error("Unable to connect to AVM FRITZ!Box call monitor: %s", ex)
         raise ConfigEntryNotReady from ex
 
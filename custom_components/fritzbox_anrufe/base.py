@@ -4,23 +4,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import timedelta
 import logging
 import re
-
-from fritzconnection.lib.fritzphonebook import FritzPhonebook
+from typing import TYPE_CHECKING
 
 from homeassistant.util import Throttle
 
-from .const import REGEX_NUMBER, UNKNOWN_NAME
+from .const import (
+    MAX_EXTENSION_LENGTH,
+    MIN_PARTIAL_MATCH_LENGTH,
+    REGEX_NUMBER,
+    UNKNOWN_NAME,
+)
+
+if TYPE_CHECKING:
+    from fritzconnection.lib.fritzphonebook import FritzPhonebook
 
 _LOGGER = logging.getLogger(__name__)
 
 # Return cached results if phonebook was downloaded less then this time ago.
 MIN_TIME_PHONEBOOK_UPDATE = timedelta(hours=6)
 
+REGEX_NUMBER_PATTERN = re.compile(REGEX_NUMBER)
+
 
 @dataclass
 class Contact:
@@ -42,6 +52,130 @@ class Contact:
 unknown_contact = Contact(UNKNOWN_NAME)
 
 
+class _TrieNode:
+    """Node of a NumberTrie."""
+
+    __slots__ = ("ambiguous", "children", "contact", "height", "subtree_contact")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.contact: Contact | None = None
+        self.subtree_contact: Contact | None = None
+        self.ambiguous = False
+        self.height = 0
+
+    def add(self, contact: Contact, height: int) -> None:
+        """Record a contact stored height digits below this node."""
+        if self.subtree_contact is None and not self.ambiguous:
+            self.subtree_contact = contact
+        elif self.subtree_contact is not contact:
+            self.subtree_contact = None
+            self.ambiguous = True
+        self.height = max(self.height, height)
+
+
+class NumberTrie:
+    """Digit trie over phonebook numbers."""
+
+    def __init__(self, number_dict: dict[str, Contact]) -> None:
+        """Build the trie from a number to contact mapping."""
+        self._root = _TrieNode()
+        for number, contact in number_dict.items():
+            self._insert(number, contact)
+
+    def _insert(self, number: str, contact: Contact) -> None:
+        """Insert a number."""
+        node = self._root
+        for depth, digit in enumerate(number):
+            node.add(contact, len(number) - depth)
+            node = node.children.setdefault(digit, _TrieNode())
+        node.add(contact, 0)
+        node.contact = contact
+
+    def _walk(self, number: str) -> list[_TrieNode]:
+        """Return the nodes along the longest stored path matching number."""
+        node = self._root
+        path = [node]
+        for digit in number:
+            if digit not in node.children:
+                break
+            node = node.children[digit]
+            path.append(node)
+        return path
+
+    def longest_prefix(self, number: str) -> Contact | None:
+        """Return the contact of a stored number extending or extended by number.
+
+        Both numbers have to share at least MIN_PARTIAL_MATCH_LENGTH leading
+        digits and differ by at most MAX_EXTENSION_LENGTH trailing digits.
+        """
+        path = self._walk(number)
+        depth = len(path) - 1
+        node = path[depth]
+        if (
+            depth == len(number) >= MIN_PARTIAL_MATCH_LENGTH
+            and node.height <= MAX_EXTENSION_LENGTH
+            and node.subtree_contact
+        ):
+            return node.subtree_contact
+        lowest = max(MIN_PARTIAL_MATCH_LENGTH, len(number) - MAX_EXTENSION_LENGTH)
+        for node in reversed(path[lowest:]):
+            if node.contact:
+                return node.contact
+        return None
+
+
+def national_number(number: str, prefixes: Iterable[str]) -> str:
+    """Return number with its international dialing prefix bridged.
+
+    Only the "00" and "+" forms and the configured international prefixes,
+    with or without the trunk "0", are rewritten, so area and country codes
+    still have to match.
+    """
+    if number.startswith("00"):
+        number = "+" + number[2:]
+    for prefix in prefixes:
+        if prefix.startswith("00"):
+            prefix = "+" + prefix[2:]
+        if prefix.startswith("+") and number.startswith(prefix):
+            number = number[len(prefix) :]
+            return number if number.startswith("0") else "0" + number
+    return number
+
+
+class NumberIndex:
+    """Immutable lookup index over the numbers of one phonebook download."""
+
+    def __init__(
+        self, number_dict: dict[str, Contact], prefixes: list[str] | None = None
+    ) -> None:
+        """Build the index."""
+        self.number_dict = number_dict
+        self.prefixes = prefixes or []
+        self.prefix_trie = NumberTrie(number_dict)
+        self.national_dict = {
+            national_number(number, self.prefixes): contact
+            for number, contact in number_dict.items()
+        }
+
+    def find(self, candidates: list[str]) -> Contact:
+        """Return the best matching contact for the candidate numbers."""
+        for candidate in candidates:
+            with suppress(KeyError):
+                return self.number_dict[candidate]
+
+        # An exact match in another dialing format wins over an extension.
+        for candidate in candidates:
+            with suppress(KeyError):
+                return self.national_dict[national_number(candidate, self.prefixes)]
+        for candidate in candidates:
+            if contact := self.prefix_trie.longest_prefix(candidate):
+                return contact
+
+        return unknown_contact
+
+
 class FritzBoxPhonebook:
     """Connects to a FritzBox router and downloads its phone book."""
 
@@ -49,6 +183,7 @@ class FritzBoxPhonebook:
     phonebook_dict: dict[str, list[str]]
     contacts: list[Contact]
     number_dict: dict[str, Contact]
+    index: NumberIndex
 
     def __init__(
         self,
@@ -67,6 +202,8 @@ class FritzBoxPhonebook:
 
     def init_phonebook(self) -> None:
         """Establish a connection to the FRITZ!Box and check if phonebook_id is valid."""
+        from fritzconnection.lib.fritzphonebook import FritzPhonebook
+
         self.fph = FritzPhonebook(
             address=self.host,
             user=self.username,
@@ -86,26 +223,41 @@ class FritzBoxPhonebook:
             for c in self.fph.phonebook.contacts
         ]
         self.number_dict = {nr: c for c in self.contacts for nr in c.numbers}
+        self.index = NumberIndex(self.number_dict, self.prefixes)
         _LOGGER.debug("Fritz!Box phone book successfully updated")
 
     def get_phonebook_ids(self) -> list[int]:
         """Return list of phonebook ids."""
         return self.fph.phonebook_ids  # type: ignore[no-any-return]
 
+    @staticmethod
+    def _get_candidates(number: str, prefixes: list[str]) -> list[str]:
+        """Return the number and its variants with the given prefixes."""
+        candidates = [number]
+        for prefix in prefixes:
+            candidates.append(prefix + number)
+            candidates.append(prefix + number.lstrip("0"))
+        return candidates
+
     def get_contact(self, number: str) -> Contact:
         """Return a contact for a given phone number."""
-        number = re.sub(REGEX_NUMBER, "", str(number))
-
-        with suppress(KeyError):
-            return self.number_dict[number]
-
-        if not self.prefixes:
-            return unknown_contact
+        number = REGEX_NUMBER_PATTERN.sub("", str(number))
+        return self.index.find(self._get_candidates(number, self.prefixes or []))
 
-        for prefix in self.prefixes:
-            with suppress(KeyError):
-                return self.number_dict[prefix + number]
-            with suppress(KeyError):
-                return self.number_dict[prefix + number.lstrip("0")]
-
-        return unknown_contact
+    def get_contacts(self, numbers: Iterable[str]) -> dict[str, Contact]:
+        """Return the contacts for many phone numbers from one index snapshot."""
+        index = self.index
+        prefixes = self.prefixes or []
+        sub = REGEX_NUMBER_PATTERN.sub
+        contacts: dict[str, Contact] = {}
+        by_number: dict[str, Contact] = {}
+        for number in numbers:
+            if number in contacts:
+                continue
+            normalized = sub("", str(number))
+            if (contact := by_number.get(normalized)) is None:
+                contact = by_number[normalized] = index.find(
+                    self._get_candidates(normalized, prefixes)
+                )
+            contacts[number] = contact
+        return contacts
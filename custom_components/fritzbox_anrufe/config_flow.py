@@ -8,9 +8,6 @@ from collections.abc import Mapping
 from enum import StrEnum
 from typing import Any, cast
 
-from fritzconnection import FritzConnection
-from fritzconnection.core.exceptions import FritzConnectionException, FritzSecurityError
-from requests.exceptions import ConnectionError as RequestsConnectionError
 import voluptuous as vol
 
 from homeassistant.config_entries import (
@@ -24,6 +21,9 @@ from homeassistant.core import callback
 
 from .base import FritzBoxPhonebook
 from .const import (
+    CONF_CALL_EVENTS,
+    CONF_DEVICES,
+    CONF_MSNS,
     CONF_PHONEBOOK,
     CONF_PREFIXES,
     DEFAULT_HOST,
@@ -52,6 +52,7 @@ class ConnectResult(StrEnum):
     INVALID_AUTH = "invalid_auth"
     INSUFFICIENT_PERMISSIONS = "insufficient_permissions"
     MALFORMED_PREFIXES = "malformed_prefixes"
+    MALFORMED_SUB_SENSORS = "malformed_sub_sensors"
     NO_DEVIES_FOUND = "no_devices_found"
     SUCCESS = "success"
 
@@ -92,6 +93,13 @@ class FritzBoxCallMonitorConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def _try_connect(self) -> ConnectResult:
         """Try to connect and check auth."""
+        from fritzconnection import FritzConnection
+        from fritzconnection.core.exceptions import (
+            FritzConnectionException,
+            FritzSecurityError,
+        )
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+
         self._fritzbox_phonebook = FritzBoxPhonebook(
             host=self._host,
             username=self._username,
@@ -280,16 +288,36 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlow):
             return None
         return [prefix.strip() for prefix in prefixes.split(",")]
 
+    @classmethod
+    def _get_list_of_entries(cls, entries: str | None) -> list[str] | None:
+        """Get list of entries without blank or duplicate ones."""
+        if entries is None:
+            return None
+        stripped = (entry.strip() for entry in entries.split(","))
+        return list(dict.fromkeys(entry for entry in stripped if entry))
+
     def _get_option_schema_prefixes(self) -> vol.Schema:
-        """Get option schema for entering prefixes."""
+        """Get option schema for entering prefixes, sub-sensors and modes."""
+        options = self.config_entry.options
         return vol.Schema(
             {
                 vol.Optional(
                     CONF_PREFIXES,
-                    description={
-                        "suggested_value": self.config_entry.options.get(CONF_PREFIXES)
-                    },
-                ): str
+                    description={"suggested_value": options.get(CONF_PREFIXES)},
+                ): str,
+                **{
+                    vol.Optional(
+                        key,
+                        description={
+                            "suggested_value": ", ".join(options.get(key) or ())
+                            or None
+                        },
+                    ): str
+                    for key in (CONF_DEVICES, CONF_MSNS)
+                },
+                vol.Optional(
+                    CONF_CALL_EVENTS, default=options.get(CONF_CALL_EVENTS, False)
+                ): bool,
             }
         )
 
@@ -316,6 +344,22 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlow):
                 errors={"base": ConnectResult.MALFORMED_PREFIXES},
             )
 
+        devices: str | None = user_input.get(CONF_DEVICES)
+        msns: str | None = user_input.get(CONF_MSNS)
+
+        if not (self._are_prefixes_valid(devices) and self._are_prefixes_valid(msns)):
+            return self.async_show_form(
+                step_id="init",
+                data_schema=option_schema_prefixes,
+                errors={"base": ConnectResult.MALFORMED_SUB_SENSORS},
+            )
+
         return self.async_create_entry(
-            title="", data={CONF_PREFIXES: self._get_list_of_prefixes(prefixes)}
+            title="",
+            data={
+                CONF_PREFIXES: self._get_list_of_prefixes(prefixes),
+                CONF_DEVICES: self._get_list_of_entries(devices),
+                CONF_MSNS: self._get_list_of_entries(msns),
+                CONF_CALL_EVENTS: user_input.get(CONF_CALL_EVENTS, False),
+            },
         )
@@ -17,7 +17,10 @@ class FritzState(StrEnum):
     DISCONNECT = "DISCONNECT"
 
 
+ATTR_DURATION = "duration"
+ATTR_NUMBERS = "numbers"
 ATTR_PREFIXES = "prefixes"
+ATTR_SUB_ENTITY_IDS = "sub_entity_ids"
 
 FRITZ_ATTR_NAME = "name"
 FRITZ_ATTR_SERIAL_NUMBER = "Serial"
@@ -26,9 +29,19 @@ UNKNOWN_NAME = "unknown"
 SERIAL_NUMBER = "serial_number"
 REGEX_NUMBER = r"[^\d\+]"
 
+# Bounds for matching numbers that only differ by a direct-dial extension.
+MIN_PARTIAL_MATCH_LENGTH = 6
+MAX_EXTENSION_LENGTH = 5
+
+SERVICE_LOOKUP = "lookup"
+SERVICE_PROFILE = "profile"
+
 CONF_PHONEBOOK = "phonebook"
 CONF_PHONEBOOK_NAME = "phonebook_name"
 CONF_PREFIXES = "prefixes"
+CONF_DEVICES = "devices"
+CONF_MSNS = "msns"
+CONF_CALL_EVENTS = "call_events"
 
 DEFAULT_HOST = "169.254.1.1" 
 DEFAULT_PORT = 1012
@@ -37,6 +50,7 @@ DEFAULT_PHONEBOOK = 0
 DEFAULT_NAME = "Phone"
 
 DOMAIN: Final = "fritzbox_anrufe"
+EVENT_CALL: Final = f"{DOMAIN}_call"
 MANUFACTURER: Final = "AVM"
 
 PLATFORMS = [Platform.SENSOR]
@@ -0,0 +1,53 @@
+# custom_components/fritzbox_anrufe/monitor.py
+
+"""Socket connection to the Fritz!Box call monitor.
+
+Importing any fritzconnection module loads FritzConnection and requests. The
+integration therefore only imports it where it is first used, in executor
+jobs or the monitor thread, and this module is imported lazily for the same
+reason.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+from typing import Any, cast
+
+from fritzconnection.core.fritzmonitor import FritzMonitor
+
+_LOGGER = logging.getLogger(__name__)
+
+# TCP keepalive settings to detect a dead or half-open monitor connection.
+KEEPALIVE_IDLE = 10
+KEEPALIVE_INTERVAL = 5
+KEEPALIVE_COUNT = 3
+# Drop the connection if sent data or probes stay unacknowledged (ms).
+TCP_USER_TIMEOUT = 25000
+
+
+class KeepaliveFritzMonitor(FritzMonitor):
+    """FritzMonitor with tight TCP keepalive timeouts."""
+
+    def _get_connected_socket(self) -> socket.socket:
+        """Return a connected socket that detects dead peers within seconds."""
+        sock = cast(socket.socket, super()._get_connected_socket())
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (
+            ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+            ("TCP_USER_TIMEOUT", TCP_USER_TIMEOUT),
+        ):
+            # Not every platform supports every option.
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        return sock
+
+    def _monitor(self, *args: Any, **kwargs: Any) -> None:
+        """Run the monitor loop and end quietly when the socket fails."""
+        try:
+            super()._monitor(*args, **kwargs)
+        except OSError as err:
+            _LOGGER.debug("Monitor socket failed: %s", err)
+            self.monitor_thread = None
@@ -0,0 +1,139 @@
+# custom_components/fritzbox_anrufe/profiler.py
+
+"""On-demand profiling of the fritzbox_anrufe code paths."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+import logging
+import os
+import sys
+from threading import Event as ThreadingEvent, Thread, get_ident
+import tracemalloc
+from types import FrameType
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_DIR = os.path.dirname(__file__)
+
+SAMPLE_INTERVAL = 0.02
+MAX_STACK_DEPTH = 30
+TRACEMALLOC_FRAMES = 25
+REPORT_LIMIT = 25
+
+
+class StackSampler:
+    """Sample the stacks of all threads while they run integration code."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        """Initialize the sampler."""
+        self._interval = interval
+        self._stopped = ThreadingEvent()
+        self._thread: Thread | None = None
+        self._started_tracemalloc = False
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self.samples = 0
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.functions: Counter[str] = Counter()
+        self._filenames: dict[str, str] = {}
+
+    def start(self) -> None:
+        """Start sampling and tracing memory allocations."""
+        if tracemalloc.is_tracing():
+            # Earlier allocations are traced too, report the change since now.
+            self._snapshot = tracemalloc.take_snapshot()
+        else:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._thread = Thread(target=self._run, name=f"{__name__}.sampler")
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stop sampling and return the report."""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        return self._report(snapshot)
+
+    def _run(self) -> None:
+        """Collect stack samples until stopped."""
+        own_ident = get_ident()
+        while not self._stopped.wait(self._interval):
+            for ident, frame in sys._current_frames().items():  # noqa: SLF001
+                if ident != own_ident:
+                    self._sample(frame)
+
+    def _relpath(self, filename: str) -> str:
+        """Return a filename relative to the custom_components directory."""
+        if (relpath := self._filenames.get(filename)) is None:
+            relpath = self._filenames[filename] = os.path.relpath(
+                filename, os.path.dirname(PACKAGE_DIR)
+            )
+        return relpath
+
+    def _sample(self, frame: FrameType | None) -> None:
+        """Record a stack if it passes through integration code."""
+        frames: list[FrameType] = []
+        in_package = False
+        while frame is not None and len(frames) < MAX_STACK_DEPTH:
+            frames.append(frame)
+            in_package = in_package or frame.f_code.co_filename.startswith(
+                PACKAGE_DIR
+            )
+            frame = frame.f_back
+        # Most threads never run integration code, keep their samples cheap.
+        if not in_package:
+            return
+        stack: list[str] = []
+        functions: set[str] = set()
+        for frame in frames:
+            code = frame.f_code
+            filename = self._relpath(code.co_filename)
+            stack.append(f"{filename}:{frame.f_lineno} {code.co_name}")
+            functions.add(f"{filename} {code.co_name}")
+        self.samples += 1
+        self.stacks[tuple(stack)] += 1
+        self.functions.update(functions)
+
+    def _report(self, snapshot: tracemalloc.Snapshot) -> str:
+        """Return the sampled stacks and allocation statistics as text."""
+        lines = [f"Stack samples in integration code: {self.samples}", ""]
+        lines.append("Inclusive samples per function:")
+        lines.extend(
+            f"{count:8d}  {function}"
+            for function, count in self.functions.most_common(REPORT_LIMIT)
+        )
+        lines.extend(["", "Most frequent stacks (innermost frame first):"])
+        for stack, count in self.stacks.most_common(REPORT_LIMIT):
+            lines.append(f"{count:8d}")
+            lines.extend(f"          {location}" for location in stack)
+
+        filters = [
+            tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, "*"), all_frames=True),
+            # Leave out the sampler's own bookkeeping.
+            tracemalloc.Filter(False, __file__, all_frames=True),
+        ]
+        snapshot = snapshot.filter_traces(filters)
+        if self._snapshot is not None:
+            previous = self._snapshot.filter_traces(filters)
+            lines.extend(["", "Allocations by integration code paths (change):"])
+            lines.extend(
+                f"  {stat}"
+                for stat in snapshot.compare_to(previous, "lineno")[:REPORT_LIMIT]
+            )
+        lines.extend(["", "Allocations by integration code paths (total):"])
+        lines.extend(
+            f"  {stat}" for stat in snapshot.statistics("lineno")[:REPORT_LIMIT]
+        )
+        return "\n".join(lines) + "\n"
+
+
+def write_report(path: str, report: str) -> None:
+    """Write a profiling report to path."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"# {datetime.now().isoformat()}\n{report}")
+    _LOGGER.info("Wrote profiling report to %s", path)
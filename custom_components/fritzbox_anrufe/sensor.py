@@ -9,34 +9,56 @@ from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
 import queue
+import random
 from threading import Event as ThreadingEvent, Thread
-from time import sleep
-from typing import Any, cast
-
-from fritzconnection.core.fritzmonitor import FritzMonitor
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, cast
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_STATE,
+    CONF_HOST,
+    CONF_PORT,
+    EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
+)
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import FritzBoxCallMonitorConfigEntry
-from .base import Contact, FritzBoxPhonebook
+from .base import REGEX_NUMBER_PATTERN, Contact, FritzBoxPhonebook
 from .const import (
     ATTR_PREFIXES,
+    ATTR_SUB_ENTITY_IDS,
+    CONF_CALL_EVENTS,
+    CONF_DEVICES,
+    CONF_MSNS,
     CONF_PHONEBOOK,
     CONF_PREFIXES,
     DOMAIN,
+    EVENT_CALL,
     MANUFACTURER,
     SERIAL_NUMBER,
     FritzState,
 )
 
+if TYPE_CHECKING:
+    from fritzconnection.core.fritzmonitor import FritzMonitor
+
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(hours=3)
 
+# Capped exponential backoff between reconnection attempts (seconds).
+RECONNECT_DELAY_BASE = 1
+RECONNECT_DELAY_MAX = 300
+# Only a connection that stayed up this long resets the backoff (seconds).
+STABLE_CONNECTION_TIME = 60
+
+EVENT_QUEUE_TIMEOUT = 2
+
 
 class CallState(StrEnum):
     """Fritz sensor call states."""
@@ -47,6 +69,26 @@ class CallState(StrEnum):
     IDLE = "idle"
 
 
+class ConnectionState(StrEnum):
+    """Fritz call monitor connection states."""
+
+    CONNECTED = "connected"
+    CONNECTING = "connecting"
+    DISCONNECTED = "disconnected"
+
+
+class SubSensorKind(StrEnum):
+    """What a call sub-sensor is restricted to."""
+
+    DEVICE = "device"
+    MSN = "msn"
+
+
+def normalize_msn(msn: str) -> str:
+    """Return an own number in the form used as sub-sensor key."""
+    return REGEX_NUMBER_PATTERN.sub("", msn)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: FritzBoxCallMonitorConfigEntry,
@@ -61,8 +103,36 @@ async def async_setup_entry(
     host: str = config_entry.data[CONF_HOST]
     port: int = config_entry.data[CONF_PORT]
 
+    call_events: bool = config_entry.options.get(CONF_CALL_EVENTS, False)
+
     unique_id = f"{serial_number}-{phonebook_id}"
 
+    sub_sensor_keys = {
+        SubSensorKind.DEVICE: (
+            device.strip() for device in config_entry.options.get(CONF_DEVICES) or ()
+        ),
+        SubSensorKind.MSN: (
+            normalize_msn(msn) for msn in config_entry.options.get(CONF_MSNS) or ()
+        ),
+    }
+    sub_sensors = [
+        FritzBoxCallSubSensor(
+            kind=kind,
+            key=key,
+            unique_id=unique_id,
+            fritzbox_phonebook=fritzbox_phonebook,
+            call_events=call_events,
+        )
+        for kind, keys in sub_sensor_keys.items()
+        # Skip blank entries and entries that are the same once normalized.
+        for key in dict.fromkeys(keys)
+        if key
+    ]
+    connection_sensor = FritzBoxConnectionSensor(
+        phonebook_name=config_entry.title,
+        unique_id=unique_id,
+        fritzbox_phonebook=fritzbox_phonebook,
+    )
     sensor = FritzBoxCallSensor(
         phonebook_name=config_entry.title,
         unique_id=unique_id,
@@ -70,19 +140,154 @@ async def async_setup_entry(
         prefixes=prefixes,
         host=host,
         port=port,
+        connection_sensor=connection_sensor,
+        sub_sensors=sub_sensors,
+        call_events=call_events,
     )
 
-    async_add_entities([sensor])
+    async_add_entities([connection_sensor, sensor, *sub_sensors])
 
 
-class FritzBoxCallSensor(SensorEntity):
-    """Implementation of a Fritz!Box call monitor."""
+def _device_info(
+    unique_id: str, fritzbox_phonebook: FritzBoxPhonebook
+) -> DeviceInfo:
+    """Return the device info shared by all entities of a phonebook."""
+    return DeviceInfo(
+        configuration_url=fritzbox_phonebook.fph.fc.address,
+        identifiers={(DOMAIN, unique_id)},
+        manufacturer=MANUFACTURER,
+        model=fritzbox_phonebook.fph.modelname,
+        name=fritzbox_phonebook.fph.modelname,
+        sw_version=fritzbox_phonebook.fph.fc.system_version,
+    )
+
+
+class FritzBoxConnectionSensor(SensorEntity):
+    """State of the connection to the Fritz!Box call monitor."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "connection"
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_options = list(ConnectionState)
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        phonebook_name: str,
+        unique_id: str,
+        fritzbox_phonebook: FritzBoxPhonebook,
+    ) -> None:
+        """Initialize the sensor."""
+        self._attr_translation_placeholders = {"phonebook_name": phonebook_name}
+        self._attr_unique_id = f"{unique_id}-connection"
+        self._attr_native_value = ConnectionState.DISCONNECTED
+        self._attr_device_info = _device_info(unique_id, fritzbox_phonebook)
+
+    def set_state(self, state: ConnectionState) -> None:
+        """Set the state and write it if the entity has been added."""
+        if self._attr_native_value == state:
+            return
+        self._attr_native_value = state
+        if self.hass is not None:
+            self.schedule_update_ha_state()
+
+
+class FritzBoxCallStateSensor(SensorEntity):
+    """Base class for sensors showing the state of calls."""
 
     _attr_has_entity_name = True
-    _attr_translation_key = DOMAIN
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = list(CallState)
 
+    def __init__(self, call_events: bool) -> None:
+        """Initialize the sensor."""
+        self._call_events = call_events
+        self._attributes: dict[str, str | bool] = {}
+
+    def set_state(self, state: CallState) -> None:
+        """Set the state."""
+        self._attr_native_value = state
+
+    def set_attributes(self, attributes: Mapping[str, str | bool]) -> None:
+        """Set the state attributes."""
+        self._attributes = {**attributes}
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, str | list[str] | bool]:
+        """Return the state attributes."""
+        return self._attributes
+
+    def update_call(
+        self, state: CallState, attributes: Mapping[str, str | bool]
+    ) -> None:
+        """Apply a call event and write the state if anything changed."""
+        if self._call_events:
+            # The call details are fired as events, keep them out of the state.
+            attributes = {}
+        if state == self._attr_native_value and attributes == self._attributes:
+            return
+        self.set_state(state)
+        self.set_attributes(attributes)
+        # Disabled or not yet added sensors have no hass to write to.
+        if self.hass is not None:
+            self.schedule_update_ha_state()
+
+
+class FritzBoxCallSubSensor(FritzBoxCallStateSensor):
+    """Calls on one device or own number, fed by the phonebook's call monitor.
+
+    Devices are keyed by their internal number, own numbers by their digits.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        kind: SubSensorKind,
+        key: str,
+        unique_id: str,
+        fritzbox_phonebook: FritzBoxPhonebook,
+        call_events: bool = False,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(call_events)
+        self.kind = kind
+        self.key = key
+
+        self._attr_translation_key = kind
+        self._attr_translation_placeholders = {kind: key}
+        self._attr_unique_id = f"{unique_id}-{kind}-{key}"
+        self._attr_native_value = CallState.IDLE
+        self._attr_device_info = _device_info(unique_id, fritzbox_phonebook)
+        # State and attributes of the active calls, latest event last.
+        self._calls: dict[str, tuple[CallState, Mapping[str, str | bool]]] = {}
+
+    def update_connection(
+        self,
+        connection_id: str,
+        state: CallState,
+        attributes: Mapping[str, str | bool],
+    ) -> None:
+        """Apply an event of one call, staying busy while other calls are active."""
+        self._calls.pop(connection_id, None)
+        if state != CallState.IDLE:
+            self._calls[connection_id] = (state, attributes)
+        elif self._calls:
+            state, attributes = next(reversed(self._calls.values()))
+        self.update_call(state, attributes)
+
+    def clear_calls(self) -> None:
+        """Forget the active calls, their end cannot be seen anymore."""
+        self._calls.clear()
+
+
+class FritzBoxCallSensor(FritzBoxCallStateSensor):
+    """Implementation of a Fritz!Box call monitor."""
+
+    _attr_translation_key = DOMAIN
+    _unrecorded_attributes = frozenset({ATTR_PREFIXES})
+
     def __init__(
         self,
         phonebook_name: str,
@@ -91,26 +296,26 @@ class FritzBoxCallSensor(SensorEntity):
         prefixes: list[str] | None,
         host: str,
         port: int,
+        connection_sensor: FritzBoxConnectionSensor | None = None,
+        sub_sensors: list[FritzBoxCallSubSensor] | None = None,
+        call_events: bool = False,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(call_events)
         self._fritzbox_phonebook = fritzbox_phonebook
         self._prefixes = prefixes
         self._host = host
         self._port = port
+        self._connection_sensor = connection_sensor
+        self._sub_sensors = {
+            (sensor.kind, sensor.key): sensor for sensor in sub_sensors or ()
+        }
         self._monitor: FritzBoxCallMonitor | None = None
-        self._attributes: dict[str, str | list[str] | bool] = {}
 
         self._attr_translation_placeholders = {"phonebook_name": phonebook_name}
         self._attr_unique_id = unique_id
         self._attr_native_value = CallState.IDLE
-        self._attr_device_info = DeviceInfo(
-            configuration_url=self._fritzbox_phonebook.fph.fc.address,
-            identifiers={(DOMAIN, unique_id)},
-            manufacturer=MANUFACTURER,
-            model=self._fritzbox_phonebook.fph.modelname,
-            name=self._fritzbox_phonebook.fph.modelname,
-            sw_version=self._fritzbox_phonebook.fph.fc.system_version,
-        )
+        self._attr_device_info = _device_info(unique_id, self._fritzbox_phonebook)
 
     async def async_added_to_hass(self) -> None:
         """Connect to FRITZ!Box to monitor its call state."""
@@ -139,32 +344,58 @@ class FritzBoxCallSensor(SensorEntity):
 
     def _stop_call_monitor(self, event: Event | None = None) -> None:
         """Stop callmonitor thread."""
-        if (
-            self._monitor
-            and self._monitor.stopped
-            and not self._monitor.stopped.is_set()
-            and self._monitor.connection
-            and self._monitor.connection.is_alive
-        ):
+        if self._monitor and not self._monitor.stopped.is_set():
             self._monitor.stopped.set()
-            self._monitor.connection.stop()
+            if self._monitor.is_connection_alive():
+                cast("FritzMonitor", self._monitor.connection).stop()
             _LOGGER.debug("Stopped monitor for: %s", self.entity_id)
 
-    def set_state(self, state: CallState) -> None:
-        """Set the state."""
-        self._attr_native_value = state
-
-    def set_attributes(self, attributes: Mapping[str, str | bool]) -> None:
-        """Set the state attributes."""
-        self._attributes = {**attributes}
+    def set_connection_state(self, state: ConnectionState) -> None:
+        """Set the state of the call monitor connection."""
+        if self._connection_sensor:
+            self._connection_sensor.set_state(state)
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | list[str] | bool]:
+    def extra_state_attributes(self) -> Mapping[str, str | list[str] | bool]:
         """Return the state attributes."""
         if self._prefixes:
-            self._attributes[ATTR_PREFIXES] = self._prefixes
+            return {**self._attributes, ATTR_PREFIXES: self._prefixes}
         return self._attributes
 
+    def update_calls(
+        self,
+        connection_id: str,
+        state: CallState,
+        attributes: Mapping[str, str | bool],
+        sub_sensors: list[FritzBoxCallSubSensor],
+    ) -> None:
+        """Apply a call event to this and the sub-sensors and fire it if enabled."""
+        if self._call_events:
+            self.hass.bus.fire(
+                EVENT_CALL,
+                {
+                    ATTR_ENTITY_ID: self.entity_id,
+                    ATTR_SUB_ENTITY_IDS: [
+                        sensor.entity_id for sensor in sub_sensors if sensor.entity_id
+                    ],
+                    ATTR_STATE: state,
+                    **attributes,
+                },
+            )
+        self.update_call(state, attributes)
+        for sensor in sub_sensors:
+            sensor.update_connection(connection_id, state, attributes)
+
+    def get_sub_sensors(
+        self, device: str = "", msn: str = ""
+    ) -> list[FritzBoxCallSubSensor]:
+        """Return the sub-sensors for a call on device with own number msn."""
+        keys = (
+            (SubSensorKind.DEVICE, device.strip()),
+            (SubSensorKind.MSN, normalize_msn(msn)),
+        )
+        return [sensor for key in keys if (sensor := self._sub_sensors.get(key))]
+
     def number_to_contact(self, number: str) -> Contact:
         """Return a contact for a given phone number."""
         return self._fritzbox_phonebook.get_contact(number)
@@ -184,41 +415,103 @@ class FritzBoxCallMonitor:
         self.connection: FritzMonitor | None = None
         self.stopped = ThreadingEvent()
         self._sensor = sensor
+        # Sub-sensors of the calls in progress, keyed by connection id.
+        self._routes: dict[str, list[FritzBoxCallSubSensor]] = {}
 
     def connect(self) -> None:
-        """Connect to the Fritz!Box."""
+        """Start the thread connecting to the Fritz!Box."""
+        Thread(target=self._run, name=f"{DOMAIN}_{self.host}").start()
+
+    def _open_connection(self) -> queue.Queue[str]:
+        """Open the socket connection and return its event queue."""
+        from .monitor import KeepaliveFritzMonitor
+
         _LOGGER.debug("Setting up socket connection")
+        self.connection = KeepaliveFritzMonitor(address=self.host, port=self.port)
+        # Reconnecting is handled by _run, let the monitor thread end instead.
+        return self.connection.start(reconnect_tries=0)
+
+    def _run(self) -> None:
+        """Keep the connection alive, reconnecting with backoff until stopped."""
+        attempt = 0
         try:
-            self.connection = FritzMonitor(address=self.host, port=self.port)
-            kwargs: dict[str, Any] = {
-                "event_queue": self.connection.start(
-                    reconnect_tries=50, reconnect_delay=120
-                )
-            }
-            Thread(target=self._process_events, kwargs=kwargs).start()
+            while not self.stopped.is_set():
+                try:
+                    # Boxes that accept and drop connections keep backing off.
+                    if self._listen():
+                        attempt = 0
+                    self._sensor.set_connection_state(ConnectionState.DISCONNECTED)
+                except Exception:
+                    _LOGGER.exception("Unexpected error monitoring %s", self.host)
+                    self._stop_connection()
+                delay = self._reconnect_delay(attempt)
+                attempt += 1
+                _LOGGER.debug("Reconnecting in %.1f seconds", delay)
+                self.stopped.wait(delay)
+        finally:
+            # A stop may have raced with the last connection attempt.
+            self._stop_connection()
+            self._sensor.set_connection_state(ConnectionState.DISCONNECTED)
+
+    def _listen(self) -> bool:
+        """Connect and process events until the connection ends or is stopped.
+
+        Return whether the connection stayed up long enough to count as stable.
+        """
+        self._sensor.set_connection_state(ConnectionState.CONNECTING)
+        try:
+            event_queue = self._open_connection()
         except OSError as err:
             self.connection = None
-            _LOGGER.error(
+            _LOGGER.warning(
                 "Cannot connect to %s on port %s: %s", self.host, self.port, err
             )
+            return False
+        for sensors in self._routes.values():
+            for sensor in sensors:
+                sensor.clear_calls()
+        self._routes.clear()
+        self._sensor.set_connection_state(ConnectionState.CONNECTED)
+        connected_at = monotonic()
+        self._process_events(event_queue)
+        if not self.stopped.is_set():
+            _LOGGER.warning("Connection has abruptly ended")
+        return monotonic() - connected_at >= STABLE_CONNECTION_TIME
+
+    def is_connection_alive(self) -> bool:
+        """Return whether the monitor thread of the connection is running."""
+        # FritzMonitor.is_alive reads monitor_thread twice, and the monitor
+        # thread clears it in between when the connection ends.
+        thread = self.connection.monitor_thread if self.connection else None
+        return thread is not None and thread.is_alive()
+
+    def _stop_connection(self) -> None:
+        """Stop the monitor thread of the connection if it is running."""
+        if self.connection and self.is_connection_alive():
+            self.connection.stop()
+
+    @staticmethod
+    def _reconnect_delay(attempt: int) -> float:
+        """Return the capped exponential backoff with jitter for attempt."""
+        cap = min(RECONNECT_DELAY_MAX, RECONNECT_DELAY_BASE * 2 ** min(attempt, 16))
+        return random.uniform(RECONNECT_DELAY_BASE, max(RECONNECT_DELAY_BASE, cap))
 
     def _process_events(self, event_queue: queue.Queue[str]) -> None:
-        """Listen to incoming or outgoing calls."""
+        """Listen to incoming or outgoing calls until the connection ends."""
         _LOGGER.debug("Connection established, waiting for events")
         while not self.stopped.is_set():
             try:
-                event = event_queue.get(timeout=10)
+                event = event_queue.get(timeout=EVENT_QUEUE_TIMEOUT)
             except queue.Empty:
-                if (
-                    not cast(FritzMonitor, self.connection).is_alive
-                    and not self.stopped.is_set()
-                ):
-                    _LOGGER.error("Connection has abruptly ended")
-                _LOGGER.debug("Empty event queue")
+                if not self.is_connection_alive():
+                    return
                 continue
             else:
                 _LOGGER.debug("Received event: %s", event)
-                self._parse(event)
+                try:
+                    self._parse(event)
+                except Exception:
+                    _LOGGER.exception("Cannot process event: %s", event)
                 sleep(1)
 
     def _parse(self, event: str) -> None:
@@ -228,8 +521,9 @@ class FritzBoxCallMonitor:
         df_out = "%Y-%m-%dT%H:%M:%S"
         isotime = datetime.strptime(line[0], df_in).strftime(df_out)
         att: dict[str, str | bool]
+        sub_sensors: list[FritzBoxCallSubSensor]
         if line[1] == FritzState.RING:
-            self._sensor.set_state(CallState.RINGING)
+            state = CallState.RINGING
             contact = self._sensor.number_to_contact(line[3])
             att = {
                 "type": "incoming",
@@ -240,9 +534,12 @@ class FritzBoxCallMonitor:
                 "from_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
+            # The device is only known once it answers the call.
+            sub_sensors = self._routes[line[2]] = self._sensor.get_sub_sensors(
+                msn=line[4]
+            )
         elif line[1] == FritzState.CALL:
-            self._sensor.set_state(CallState.DIALING)
+            state = CallState.DIALING
             contact = self._sensor.number_to_contact(line[5])
             att = {
                 "type": "outgoing",
@@ -253,9 +550,11 @@ class FritzBoxCallMonitor:
                 "to_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
+            sub_sensors = self._routes[line[2]] = self._sensor.get_sub_sensors(
+                device=line[3], msn=line[4]
+            )
         elif line[1] == FritzState.CONNECT:
-            self._sensor.set_state(CallState.TALKING)
+            state = CallState.TALKING
             contact = self._sensor.number_to_contact(line[4])
             att = {
                 "with": line[4],
@@ -264,9 +563,16 @@ class FritzBoxCallMonitor:
                 "with_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
+            sub_sensors = self._routes.setdefault(line[2], [])
+            sub_sensors.extend(
+                sensor
+                for sensor in self._sensor.get_sub_sensors(device=line[3])
+                if sensor not in sub_sensors
+            )
         elif line[1] == FritzState.DISCONNECT:
-            self._sensor.set_state(CallState.IDLE)
+            state = CallState.IDLE
             att = {"duration": line[3], "closed": isotime}
-            self._sensor.set_attributes(att)
-        self._sensor.schedule_update_ha_state()
+            sub_sensors = self._routes.pop(line[2], [])
+        else:
+            return
+        self._sensor.update_calls(line[2], state, att, sub_sensors)
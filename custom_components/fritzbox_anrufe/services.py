@@ -0,0 +1,112 @@
+# custom_components/fritzbox_anrufe/services.py
+
+"""Services for the fritzbox_anrufe integration."""
+
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .base import FritzBoxPhonebook
+from .const import (
+    ATTR_DURATION,
+    ATTR_NUMBERS,
+    DOMAIN,
+    SERVICE_LOOKUP,
+    SERVICE_PROFILE,
+)
+from .profiler import StackSampler, write_report
+
+DEFAULT_PROFILE_DURATION = 60
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+SERVICE_LOOKUP_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_NUMBERS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+def _get_phonebook(hass: HomeAssistant, entry_id: str) -> FritzBoxPhonebook:
+    """Return the phonebook of a loaded config entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(f"Unknown config entry: {entry_id}")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Config entry not loaded: {entry.title}")
+    return entry.runtime_data  # type: ignore[no-any-return]
+
+
+def _lookup(phonebook: FritzBoxPhonebook, numbers: list[str]) -> ServiceResponse:
+    """Return the lookup service response for numbers."""
+    contacts = phonebook.get_contacts(numbers)
+    return {
+        ATTR_NUMBERS: {
+            number: {"name": contact.name, "vip": contact.vip}
+            for number, contact in contacts.items()
+        }
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the fritzbox_anrufe services."""
+    profile_lock = asyncio.Lock()
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Sample stacks and allocations of the integration for a while."""
+        if profile_lock.locked():
+            raise HomeAssistantError("Profiling is already running")
+        async with profile_lock:
+            sampler = StackSampler()
+            await hass.async_add_executor_job(sampler.start)
+            try:
+                await asyncio.sleep(call.data[ATTR_DURATION])
+            finally:
+                report = await hass.async_add_executor_job(sampler.stop)
+            path = hass.config.path(
+                f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.txt"
+            )
+            await hass.async_add_executor_job(write_report, path, report)
+
+    async def async_lookup(call: ServiceCall) -> ServiceResponse:
+        """Look up the contacts for a batch of phone numbers."""
+        phonebook = _get_phonebook(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        # Large batches take a while, match them against the index snapshot
+        # outside of the event loop.
+        return await hass.async_add_executor_job(
+            _lookup, phonebook, call.data[ATTR_NUMBERS]
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=SERVICE_PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOOKUP,
+        async_lookup,
+        schema=SERVICE_LOOKUP_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
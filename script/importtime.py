@@ -0,0 +1,71 @@
+"""Measure the import time the fritzbox_anrufe modules add to Home Assistant.
+
+Run from the repository root with Home Assistant installed:
+
+    python script/importtime.py
+
+Every module is imported in a fresh interpreter with ``python -X importtime``
+after the Home Assistant modules that are loaded during startup anyway, so only
+the integration and the dependencies it pulls in are counted.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+MODULES = (
+    "custom_components.fritzbox_anrufe",
+    "custom_components.fritzbox_anrufe.config_flow",
+    "custom_components.fritzbox_anrufe.sensor",
+)
+
+PRELOADED = (
+    "homeassistant.config_entries",
+    "homeassistant.components.sensor",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+)
+
+MARKER = "--- integration imports ---"
+TOP = 10
+
+
+def measure(module: str) -> list[tuple[int, str]]:
+    """Return the self import time in microseconds per module loaded by module."""
+    code = "; ".join(
+        [
+            *(f"import {name}" for name in PRELOADED),
+            f"import sys; sys.stderr.write({MARKER!r} + '\\n')",
+            f"import {module}",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    lines = result.stderr.split(MARKER, 1)[1].splitlines()
+    timings = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            timings.append((int(self_us), name.strip()))
+    return timings
+
+
+def main() -> None:
+    """Print the import time of each integration module."""
+    for module in MODULES:
+        timings = measure(module)
+        total = sum(self_us for self_us, _ in timings)
+        print(f"{module}: {total / 1000:.1f} ms in {len(timings)} modules")
+        for self_us, name in sorted(timings, reverse=True)[:TOP]:
+            print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Estimate the recorder load of the call sensor per 1,000 calls.
+
+Run from the repository root with Home Assistant installed:
+
+    python script/recorder_load.py
+
+The call monitor parser is fed a synthetic stream of incoming and outgoing
+calls. Every state write and fired event is counted the way the recorder
+stores it: one row per state or event, and one row for each distinct
+attributes or event data blob, which are shared between rows by content.
+The "before" mode records the prefixes attribute as it was before it got
+excluded from recording. The last mode excludes the call event type in the
+recorder configuration, which keeps the state history but drops the details.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.fritzbox_anrufe.base import Contact
+from custom_components.fritzbox_anrufe.sensor import (
+    FritzBoxCallMonitor,
+    FritzBoxCallSensor,
+)
+
+CALLS = 1000
+PREFIXES = ["+49", "+4930"]
+# Attributes Home Assistant adds to every recorded state of the sensor.
+COMMON_ATTRIBUTES = {"device_class": "enum", "friendly_name": "Call monitor Phone"}
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Return data serialized like the recorder does."""
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
+class RecorderModel:
+    """Count the rows and bytes the recorder would store."""
+
+    def __init__(self, record_all_attributes: bool, record_events: bool) -> None:
+        """Initialize the model."""
+        self.record_all_attributes = record_all_attributes
+        self.record_events = record_events
+        self.rows: Counter[str] = Counter()
+        self.bytes = 0
+        self._blobs: set[bytes] = set()
+        self._last_state: tuple[str, bytes] | None = None
+
+    def _store_blob(self, table: str, blob: bytes) -> None:
+        """Store a shared attributes or event data blob."""
+        if blob not in self._blobs:
+            self._blobs.add(blob)
+            self.rows[table] += 1
+            self.bytes += len(blob)
+
+    def write_state(self, sensor: FritzBoxCallSensor) -> None:
+        """Record a state write of the sensor."""
+        attributes = dict(sensor.extra_state_attributes)
+        if not self.record_all_attributes:
+            for key in sensor._unrecorded_attributes:  # noqa: SLF001
+                attributes.pop(key, None)
+        blob = _dumps({**COMMON_ATTRIBUTES, **attributes})
+        state = (str(sensor.native_value), blob)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.rows["states"] += 1
+        self._store_blob("state_attributes", blob)
+
+    def fire(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Record a fired event."""
+        if not self.record_events:
+            return
+        self.rows["events"] += 1
+        self._store_blob("event_data", _dumps(event_data))
+
+
+def _call_stream(calls: int) -> list[str]:
+    """Return the monitor lines of alternating incoming and outgoing calls."""
+    lines = []
+    start = datetime(2026, 1, 1, 8)
+    for call in range(calls):
+        time = start + timedelta(minutes=5 * call)
+        stamp = time.strftime("%d.%m.%y %H:%M:%S")
+        remote = f"0301234{call % 1000:03d}"
+        if call % 2:
+            lines.append(f"{stamp};RING;{call % 10};{remote};4930555;SIP0;")
+        else:
+            lines.append(f"{stamp};CALL;{call % 10};1;4930555;{remote};SIP0;")
+        lines.append(f"{stamp};CONNECT;{call % 10};1;{remote};")
+        lines.append(f"{stamp};DISCONNECT;{call % 10};{call % 600};")
+    return lines
+
+
+def measure(
+    call_events: bool, record_all_attributes: bool, record_events: bool
+) -> RecorderModel:
+    """Feed the call stream through the sensor and return the recorder model."""
+    model = RecorderModel(record_all_attributes, record_events)
+    phonebook: Any = SimpleNamespace(
+        fph=SimpleNamespace(
+            fc=SimpleNamespace(address="http://fritz.box", system_version="7.57"),
+            modelname="FRITZ!Box 7590",
+        ),
+        get_contact=lambda number: Contact("Erika Mustermann", [number], "1"),
+    )
+    sensor = FritzBoxCallSensor(
+        phonebook_name="Phone",
+        unique_id="serial-0",
+        fritzbox_phonebook=phonebook,
+        prefixes=PREFIXES,
+        host="fritz.box",
+        port=1012,
+        call_events=call_events,
+    )
+    hass: Any = SimpleNamespace(bus=SimpleNamespace(fire=model.fire))
+    sensor.entity_id = "sensor.call_monitor_phone"
+    sensor.hass = hass
+    setattr(sensor, "schedule_update_ha_state", lambda: model.write_state(sensor))
+    monitor = FritzBoxCallMonitor(host="fritz.box", port=1012, sensor=sensor)
+    for line in _call_stream(CALLS):
+        monitor._parse(line)  # noqa: SLF001
+    return model
+
+
+def main() -> None:
+    """Print the recorder load of each mode."""
+    for name, *mode in (
+        ("before", False, True, True),
+        ("attributes", False, False, True),
+        ("call events", True, False, True),
+        ("excluded", True, False, False),
+    ):
+        model = measure(*mode)
+        rows = ", ".join(f"{table}={count}" for table, count in model.rows.items())
+        print(
+            f"{name:12s} {sum(model.rows.values()):6d} rows"
+            f" ({rows}), {model.bytes / 1024:7.1f} KiB of JSON per {CALLS} calls"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Tests for the fritzbox_anrufe phonebook lookups."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.fritzbox_anrufe.base import (
+    Contact,
+    FritzBoxPhonebook,
+    NumberIndex,
+    unknown_contact,
+)
+
+BERLIN = Contact("Berlin office", ["030 1234567"])
+COMPANY = Contact("Company switchboard", ["+49 40 555000"])
+MOBILE = Contact("Mobile", ["+49 170 1234567"])
+
+
+def _phonebook(
+    prefixes: list[str] | None = None,
+    contacts: tuple[Contact, ...] = (BERLIN, COMPANY, MOBILE),
+) -> FritzBoxPhonebook:
+    """Return a phonebook with the test contacts, without a FRITZ!Box."""
+    phonebook = FritzBoxPhonebook(
+        host="fritz.box",
+        username="user",
+        password="password",
+        phonebook_id=0,
+        prefixes=prefixes,
+    )
+    phonebook.number_dict = {
+        number: contact
+        for contact in contacts
+        for number in contact.numbers
+    }
+    phonebook.index = NumberIndex(phonebook.number_dict, prefixes)
+    return phonebook
+
+
+@pytest.mark.parametrize(
+    ("number", "contact"),
+    [
+        ("0301234567", BERLIN),
+        ("030/123 45 67", BERLIN),
+        # Direct-dial extensions on the caller's or the stored number.
+        ("+494055500012", COMPANY),
+        ("+4940555", COMPANY),
+        # International dialing formats of stored national numbers and back.
+        ("+49301234567", BERLIN),
+        ("0049301234567", BERLIN),
+        ("+490301234567", BERLIN),
+        ("01701234567", MOBILE),
+        ("00491701234567", MOBILE),
+    ],
+)
+def test_get_contact(number: str, contact: Contact) -> None:
+    """Test numbers resolving to a contact."""
+    assert _phonebook(prefixes=["+49"]).get_contact(number) is contact
+
+
+@pytest.mark.parametrize(
+    "number",
+    [
+        # Same subscriber number in other cities.
+        "0891234567",
+        "+49891234567",
+        "04011234567",
+        # Same subscriber number in another country.
+        "+441701234567",
+        "+33301234567",
+        # Too short for an extension match.
+        "0301",
+    ],
+)
+def test_get_contact_unknown(number: str) -> None:
+    """Test numbers that only share digits with a contact stay unknown."""
+    assert _phonebook(prefixes=["+49"]).get_contact(number) is unknown_contact
+
+
+def test_get_contact_without_prefixes() -> None:
+    """Test national numbers are not bridged without a configured prefix."""
+    phonebook = _phonebook()
+    assert phonebook.get_contact("0049301234567") is unknown_contact
+    assert phonebook.get_contact("00491701234567") is MOBILE
+
+
+def test_get_contacts() -> None:
+    """Test a batch lookup keeps each distinct number as it was given."""
+    contacts = _phonebook(prefixes=["+49"]).get_contacts(
+        ["0301234567", "0891234567", "0301234567", "030 1234567", "+4940555"]
+    )
+    assert contacts == {
+        "0301234567": BERLIN,
+        "0891234567": unknown_contact,
+        "030 1234567": BERLIN,
+        "+4940555": COMPANY,
+    }
+
+
+@pytest.mark.parametrize("number", ["+49301234567", "0049301234567", "0301234567"])
+def test_get_contact_exact_before_extension(number: str) -> None:
+    """Test an exact match in any dialing format wins over an extension."""
+    company = Contact("Company", ["+49 30 123456"])
+    alice = Contact("Alice direct", ["030 1234567"])
+    phonebook = _phonebook(prefixes=["+49"], contacts=(company, alice))
+    assert phonebook.get_contact(number) is alice
@@ -0,0 +1,188 @@
+"""Tests for the fritzbox_anrufe call monitor."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.fritzbox_anrufe.base import Contact
+from custom_components.fritzbox_anrufe.sensor import (
+    RECONNECT_DELAY_BASE,
+    RECONNECT_DELAY_MAX,
+    CallState,
+    ConnectionState,
+    FritzBoxCallMonitor,
+    FritzBoxCallSensor,
+    FritzBoxCallSubSensor,
+    SubSensorKind,
+)
+
+PHONEBOOK: Any = SimpleNamespace(
+    fph=SimpleNamespace(
+        fc=SimpleNamespace(address="http://fritz.box", system_version="7.57"),
+        modelname="FRITZ!Box 7590",
+    ),
+    get_contact=lambda number: Contact("Erika Mustermann", [number]),
+)
+
+
+def _monitor(sensor: Any = None) -> FritzBoxCallMonitor:
+    """Return a call monitor that is not connected to a FRITZ!Box."""
+    if sensor is None:
+        sensor = SimpleNamespace(set_connection_state=lambda state: None)
+    return FritzBoxCallMonitor(host="fritz.box", port=1012, sensor=sensor)
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 5, 8, 9, 100])
+def test_reconnect_delay(attempt: int) -> None:
+    """Test the backoff grows with the attempts and stays within its bounds."""
+    cap = min(RECONNECT_DELAY_MAX, RECONNECT_DELAY_BASE * 2**attempt)
+    for _ in range(100):
+        delay = FritzBoxCallMonitor._reconnect_delay(attempt)
+        assert RECONNECT_DELAY_BASE <= delay <= max(RECONNECT_DELAY_BASE, cap)
+
+
+def test_run_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test only stable connections reset the backoff and errors do not end it."""
+    states: list[ConnectionState] = []
+    monitor = _monitor(SimpleNamespace(set_connection_state=states.append))
+    # Stable connection, two dropped connections, an error and a stable one.
+    results: list[bool | Exception] = [
+        True,
+        False,
+        False,
+        AttributeError("monitor_thread"),
+        True,
+    ]
+    attempts: list[int] = []
+
+    def listen() -> bool:
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if not results:
+            monitor.stopped.set()
+        return result
+
+    monkeypatch.setattr(monitor, "_listen", listen)
+    monkeypatch.setattr(monitor, "_reconnect_delay", attempts.append)
+    monkeypatch.setattr(monitor.stopped, "wait", lambda delay: None)
+    monitor._run()
+
+    assert attempts == [0, 1, 2, 3, 0]
+    assert states[-1] is ConnectionState.DISCONNECTED
+
+
+def test_is_connection_alive() -> None:
+    """Test a monitor thread cleared by the ending connection is not alive."""
+    monitor = _monitor()
+    assert not monitor.is_connection_alive()
+    monitor.connection = SimpleNamespace(monitor_thread=None)  # type: ignore[assignment]
+    assert not monitor.is_connection_alive()
+
+
+def _sub_sensor(kind: SubSensorKind, key: str) -> FritzBoxCallSubSensor:
+    """Return a sub-sensor that has not been added to hass."""
+    return FritzBoxCallSubSensor(
+        kind=kind, key=key, unique_id="serial-0", fritzbox_phonebook=PHONEBOOK
+    )
+
+
+def _sub_sensors() -> dict[str, FritzBoxCallSubSensor]:
+    """Return sub-sensors for two handsets, a trunk and an own number."""
+    return {
+        "10": _sub_sensor(SubSensorKind.DEVICE, "10"),
+        "11": _sub_sensor(SubSensorKind.DEVICE, "11"),
+        "SIP0": _sub_sensor(SubSensorKind.DEVICE, "SIP0"),
+        "555": _sub_sensor(SubSensorKind.MSN, "030555"),
+    }
+
+
+def _call_monitor(
+    sub_sensors: dict[str, FritzBoxCallSubSensor],
+) -> FritzBoxCallMonitor:
+    """Return a call monitor feeding a call sensor with the sub-sensors."""
+    sensor = FritzBoxCallSensor(
+        phonebook_name="Phone",
+        unique_id="serial-0",
+        fritzbox_phonebook=PHONEBOOK,
+        prefixes=None,
+        host="fritz.box",
+        port=1012,
+        sub_sensors=list(sub_sensors.values()),
+    )
+    return _monitor(sensor)
+
+
+def _parse(monitor: FritzBoxCallMonitor, *events: str) -> None:
+    """Feed events to the call monitor."""
+    for event in events:
+        monitor._parse(f"19.10.26 10:00:00;{event};")
+
+
+def _states(sub_sensors: dict[str, FritzBoxCallSubSensor]) -> dict[str, str]:
+    """Return the states of the sub-sensors."""
+    return {key: sensor.native_value for key, sensor in sub_sensors.items()}
+
+
+@pytest.mark.parametrize(
+    ("events", "states"),
+    [
+        (
+            ["RING;0;0301234567;030 555;SIP0"],
+            {"10": "idle", "11": "idle", "SIP0": "idle", "555": "ringing"},
+        ),
+        (
+            ["RING;0;0301234567;030555;SIP0", "CONNECT;0;10;0301234567"],
+            {"10": "talking", "11": "idle", "SIP0": "idle", "555": "talking"},
+        ),
+        (
+            ["CALL;0;11;030555;0301234567;SIP0"],
+            {"10": "idle", "11": "dialing", "SIP0": "idle", "555": "dialing"},
+        ),
+        (
+            ["CALL;0;11;030555;0301234567;SIP0", "CONNECT;0;11;0301234567"],
+            {"10": "idle", "11": "talking", "SIP0": "idle", "555": "talking"},
+        ),
+        (
+            [
+                "RING;0;0301234567;030555;SIP0",
+                "CONNECT;0;10;0301234567",
+                "DISCONNECT;0;42",
+            ],
+            {"10": "idle", "11": "idle", "SIP0": "idle", "555": "idle"},
+        ),
+    ],
+)
+def test_parse_routing(events: list[str], states: dict[str, str]) -> None:
+    """Test calls are routed to the sub-sensors of their handset and own number."""
+    sub_sensors = _sub_sensors()
+    _parse(_call_monitor(sub_sensors), *events)
+    assert _states(sub_sensors) == states
+
+
+def test_parse_concurrent_calls() -> None:
+    """Test a sub-sensor shared by two calls stays busy until both ended."""
+    sub_sensors = _sub_sensors()
+    monitor = _call_monitor(sub_sensors)
+    _parse(
+        monitor,
+        "RING;0;0301234567;030555;SIP0",
+        "CONNECT;0;10;0301234567",
+        "RING;1;0307654321;030555;SIP0",
+    )
+    assert _states(sub_sensors)["555"] == CallState.RINGING
+
+    _parse(monitor, "DISCONNECT;1;0")
+    assert _states(sub_sensors)["555"] == CallState.TALKING
+    assert sub_sensors["555"].extra_state_attributes["with"] == "0301234567"
+
+    _parse(monitor, "DISCONNECT;0;42")
+    assert _states(sub_sensors) == {
+        "10": "idle",
+        "11": "idle",
+        "SIP0": "idle",
+        "555": "idle",
+    }
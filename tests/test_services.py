@@ -0,0 +1,27 @@
+"""Tests for the fritzbox_anrufe services."""
+
+from __future__ import annotations
+
+from custom_components.fritzbox_anrufe.base import (
+    Contact,
+    FritzBoxPhonebook,
+    NumberIndex,
+)
+from custom_components.fritzbox_anrufe.services import _lookup
+
+
+def test_lookup_response() -> None:
+    """Test the response of the lookup service."""
+    contact = Contact("Erika Mustermann", ["030 1234567"], category="1")
+    phonebook = FritzBoxPhonebook(
+        host="fritz.box", username="user", password="password", prefixes=["+49"]
+    )
+    phonebook.index = NumberIndex({"0301234567": contact}, ["+49"])
+
+    assert _lookup(phonebook, ["030 1234567", "0301234567", "0891234567"]) == {
+        "numbers": {
+            "030 1234567": {"name": "Erika Mustermann", "vip": True},
+            "0301234567": {"name": "Erika Mustermann", "vip": True},
+            "0891234567": {"name": "unknown", "vip": False},
+        }
+    }